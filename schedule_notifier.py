@@ -60,17 +60,98 @@ Sample input:
     ├───────────────┼────────────────────────┼──────────────────┤
 """
 
+import functools
+import io
 import json
 import logging
+import operator
 import os
-import re
-from datetime import datetime
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import click
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+
+# slack_sdk is imported lazily inside the Slack-facing methods: the common
+# "just print the schedule" invocation never needs it, and the import alone
+# costs tens of milliseconds of cold start
+if TYPE_CHECKING:
+    from slack_sdk import WebClient
+
+# Use orjson for JSON parse/serialize when available (several times faster than
+# stdlib json); fall back to stdlib json so orjson stays an optional dependency.
+# _json_dumps returns bytes so orjson's output goes straight to disk or stdout
+# without a decode/encode round-trip.
+try:
+    import orjson
+
+    def _json_loads(s: str) -> dict:
+        return orjson.loads(s)
+
+    def _json_dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+except ImportError:
+
+    def _json_loads(s: str) -> dict:
+        return json.loads(s)
+
+    def _json_dumps(obj, pretty: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+# Month abbreviation lookup for the hand-rolled date parser; an order of
+# magnitude faster than strptime and independent of the process locale
+_MONTHS = {m: i + 1 for i, m in enumerate(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])}
+
+
+def _parse_date(date_str: str) -> date:
+    """
+    Parse a date string like "Feb 9, 2026" via the month-abbreviation table.
+
+    Raises KeyError or ValueError when the string doesn't match that shape.
+
+    Arg(s):
+        date_str (str): Date string in 'Mon D, YYYY' form.
+
+    Return Value(s):
+        date: The parsed date.
+    """
+    month_str, rest = date_str.split(' ', 1)
+    day_str, year_str = rest.split(', ')
+    return date(int(year_str), _MONTHS[month_str], int(day_str))
+
+# How long a cached user group member list is trusted before re-fetching.
+# usergroups.users.list is a Tier-2 Slack API call, so skipping it on
+# steady-state runs is worth a short window of staleness.
+_USER_GROUP_CACHE_TTL = 3600
+
+# WebClient instances keyed by token, shared across notifiers so repeated sends
+# reuse the underlying HTTP connection pool instead of re-handshaking TLS
+_SLACK_CLIENTS: Dict[str, "WebClient"] = {}
+
+
+def _get_slack_client(token: str) -> "WebClient":
+    """
+    Return a shared WebClient for the given token, creating it on first use.
+
+    Arg(s):
+        token (str): Slack API token.
+
+    Return Value(s):
+        WebClient: The cached client for this token.
+    """
+    client = _SLACK_CLIENTS.get(token)
+    if client is None:
+        from slack_sdk import WebClient
+
+        client = _SLACK_CLIENTS[token] = WebClient(token=token, timeout=10)
+    return client
 
 
 class ScheduleNotifier:
@@ -91,9 +172,19 @@ class ScheduleNotifier:
         self.schedule_file = schedule_file
         self.schedule_content = schedule_content
         self.dry_run = dry_run
-        self.schedule: List[Tuple[datetime, List[str], List[str]]] = []
-        self.slack_client: Optional[WebClient] = None
+        # Frozen after load: nothing mutates the schedule past __init__, and
+        # tuples are both smaller and faster to index than lists
+        self.schedule: Tuple[Tuple[date, Tuple[str, ...], Tuple[str, ...]], ...] = ()
+        self._start_ordinal: int = 0
+        self._cycle_length: int = 0
+        self._release_artistry: Tuple[Tuple[str, ...], ...] = ()
+        self._focused_work: Tuple[Tuple[str, ...], ...] = ()
+        # Memoize week lookups per instance; binding the cache here rather than
+        # decorating the method keeps it off the class (and off self's lifetime)
+        self._lookup = functools.lru_cache(maxsize=64)(self._lookup_impl)
+        self.slack_client: Optional["WebClient"] = None
         self.slack_user_mapping: Dict[str, str] = {}
+        self._managed_user_ids: frozenset = frozenset()
         self.slack_user_group_id: Optional[str] = None
         self._load_schedule()
         self._load_slack_user_mapping()
@@ -129,77 +220,155 @@ class ScheduleNotifier:
 
         # Only create real client if we have a token (needed for fetching current state even in dry-run)
         if token:
-            self.slack_client = WebClient(token=token)
+            self.slack_client = _get_slack_client(token)
         else:
             self.slack_client = None
             self.logger.info("[DRY RUN] No SLACK_TOKEN provided, will simulate without fetching current state")
 
     @staticmethod
-    def _parse_schedule_line(line: str) -> Optional[Tuple[datetime, List[str], List[str]]]:
+    @functools.lru_cache(maxsize=4096)
+    def _parse_schedule_line(line: str) -> Optional[Tuple[date, Tuple[str, ...], Tuple[str, ...]]]:
         """
         Parse a single schedule line and extract the date and people assignments.
 
+        Results are memoized on the raw line string, so re-parsing the same
+        schedule (or repeated lines) is a dict lookup.
+
         Arg(s):
             line (str): A line from the schedule table.
 
         Return Value(s):
-            Optional[Tuple[datetime, List[str], List[str]]]: Tuple of (date, release_artistry, focused_work)
-                or None if the line doesn't contain schedule data.
+            Optional[Tuple[date, Tuple[str, ...], Tuple[str, ...]]]: Tuple of
+                (date, release_artistry, focused_work) or None if the line doesn't
+                contain schedule data.
         """
-        # Skip separator lines and header
-        if line.strip().startswith('├') or line.strip().startswith('|') and 'Week starting' in line:
+        # Cheap prefix test: anything but a '|' row (separators, prose, blanks)
+        # is rejected before paying for the split
+        stripped = line.lstrip()
+        if not stripped or stripped[0] != '|':
             return None
 
-        # Match lines like: | Feb 9, 2026   | Fabio, Michael, Luis   | Daniele, Joep    |
-        match = re.match(r'\|\s*([A-Za-z]+\s+\d+,\s+\d+)\s*\|\s*([^|]+)\s*\|\s*([^|]+)\s*\|', line)
-        if not match:
+        # Lines like: | Feb 9, 2026   | Fabio, Michael, Luis   | Daniele, Joep    |
+        # split into ['', date, release artistry, focused work, ''] on the fixed '|' delimiter
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) != 5 or parts[0] != '':
             return None
 
-        date_str = match.group(1).strip()
-        release_artistry_str = match.group(2).strip()
-        focused_work_str = match.group(3).strip()
+        # Skip the header row
+        if parts[1] == 'Week starting':
+            return None
 
-        # Parse the date
+        # Parse dates like "Feb 9, 2026" by hand (day granularity only, so a
+        # plain date suffices); the length check cheaply rejects non-date fields
+        if len(parts[1]) > 20:
+            return None
         try:
-            week_date = datetime.strptime(date_str, "%b %d, %Y")
-        except ValueError:
+            week_date = _parse_date(parts[1])
+        except (KeyError, ValueError):
             return None
 
-        # Parse the people lists
-        release_artistry = [name.strip() for name in release_artistry_str.split(',')]
-        focused_work = [name.strip() for name in focused_work_str.split(',')]
+        # Parse the people lists (tuples so the memoized return value is hashable;
+        # interned names so the handful of rotating people share one str object)
+        release_artistry = tuple(sys.intern(name.strip()) for name in parts[2].split(','))
+        focused_work = tuple(sys.intern(name.strip()) for name in parts[3].split(','))
 
         return week_date, release_artistry, focused_work
 
     def _load_schedule(self) -> None:
         """
         Load and parse the schedule from the file or content string.
+
+        Parsed schedules from files are cached in a JSON sidecar keyed by the
+        source file's mtime and size, so repeated invocations skip the
+        line-by-line parse entirely while any edit to the source invalidates
+        the cache.
         """
-        lines = []
+        cache_path = None
+        cache_meta = None
 
         if self.schedule_content:
-            # Parse from content string
-            lines = self.schedule_content.splitlines()
+            # Parse from content string (no cache; content has no mtime to key on)
+            source = io.StringIO(self.schedule_content)
         elif self.schedule_file:
             # Parse from file
             if not self.schedule_file.exists():
                 raise FileNotFoundError(f"Schedule file not found: {self.schedule_file}")
-            with open(self.schedule_file, 'r') as f:
-                lines = f.readlines()
+            st = self.schedule_file.stat()
+            cache_meta = [st.st_mtime_ns, st.st_size]
+            cache_path = self.schedule_file.with_suffix('.parsed.json')
+            if cache_path.exists():
+                try:
+                    cached = _json_loads(cache_path.read_text())
+                    # Adopt the cache only for a fresh meta with a non-empty
+                    # entries list; anything else falls through to a reparse
+                    if (
+                        isinstance(cached, dict)
+                        and cached.get("meta") == cache_meta
+                        and isinstance(cached.get("entries"), list)
+                        and cached["entries"]
+                    ):
+                        self.schedule = tuple(
+                            (date.fromisoformat(d), tuple(map(sys.intern, ra)), tuple(map(sys.intern, fw)))
+                            for d, ra, fw in cached["entries"]
+                        )
+                        self._finalize_schedule()
+                        self.logger.debug("Loaded parsed schedule from cache: %s", cache_path)
+                        return
+                except (OSError, ValueError, KeyError, TypeError):
+                    self.logger.warning("Ignoring unreadable schedule cache: %s", cache_path)
+            source = open(self.schedule_file, 'r')
         else:
             raise ValueError("Either schedule_file or schedule_content must be provided")
 
-        for line in lines:
-            parsed = self._parse_schedule_line(line)
-            if parsed:
-                self.schedule.append(parsed)
+        entries: List[Tuple[date, Tuple[str, ...], Tuple[str, ...]]] = []
+        with source:
+            for line in source:
+                parsed = self._parse_schedule_line(line)
+                if parsed:
+                    entries.append(parsed)
+                elif entries:
+                    # Once the table has started, a non-table line marks its
+                    # end; stop scanning any trailing prose
+                    stripped = line.strip()
+                    if stripped and stripped[0] not in '|├':
+                        break
+
+        if not entries:
+            origin = "content" if self.schedule_content else str(self.schedule_file)
+            raise ValueError(f"No valid schedule entries found in {origin}")
+
+        # Schedule files are normally authored chronologically; only sort when
+        # that invariant is violated
+        in_order = all(entries[i][0] <= entries[i + 1][0] for i in range(len(entries) - 1))
+        if not in_order:
+            entries.sort(key=operator.itemgetter(0))
+
+        self.schedule = tuple(entries)
+        self._finalize_schedule()
+
+        if cache_path is not None:
+            entries = [[d.isoformat(), list(ra), list(fw)] for d, ra, fw in self.schedule]
+            tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+            try:
+                tmp_path.write_bytes(_json_dumps({"meta": cache_meta, "entries": entries}))
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                self.logger.warning("Failed to write schedule cache %s: %s", cache_path, e)
 
-        if not self.schedule:
-            source = "content" if self.schedule_content else str(self.schedule_file)
-            raise ValueError(f"No valid schedule entries found in {source}")
+    def _finalize_schedule(self) -> None:
+        """
+        Precompute the lookup structures derived from the parsed schedule.
 
-        # Sort schedule by date to ensure proper ordering
-        self.schedule = sorted(self.schedule, key=lambda x: x[0])
+        Splits the week tuples into parallel per-column lists so
+        get_schedule_for_date indexes straight into each column without
+        unpacking a 3-tuple per call.
+        """
+        self._start_ordinal = self.schedule[0][0].toordinal()
+        self._cycle_length = len(self.schedule)
+        # Alias identical lineups so equal weeks share one tuple object
+        lineup_cache: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+        self._release_artistry = tuple(lineup_cache.setdefault(ra, ra) for _, ra, _ in self.schedule)
+        self._focused_work = tuple(lineup_cache.setdefault(fw, fw) for _, _, fw in self.schedule)
 
     def _load_slack_user_mapping(self) -> None:
         """
@@ -208,9 +377,11 @@ class ScheduleNotifier:
         mapping_str = os.environ.get("SLACK_USER_MAPPING")
         if mapping_str:
             try:
-                self.slack_user_mapping = json.loads(mapping_str)
+                self.slack_user_mapping = {sys.intern(name): user_id for name, user_id in _json_loads(mapping_str).items()}
+                # The mapping is immutable after init, so derive the managed ID set once
+                self._managed_user_ids = frozenset(self.slack_user_mapping.values())
                 self.logger.info("Loaded Slack user mapping for %d users", len(self.slack_user_mapping))
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 self.logger.warning("Failed to parse SLACK_USER_MAPPING: %s", e)
                 self.slack_user_mapping = {}
 
@@ -222,46 +393,39 @@ class ScheduleNotifier:
         if self.slack_user_group_id:
             self.logger.info("Loaded Slack user group ID: %s", self.slack_user_group_id)
 
-    @staticmethod
-    def _calculate_week_in_cycle(schedule_start: datetime, target_date: datetime, cycle_length: int) -> int:
+    def _lookup_impl(self, week_bucket: int) -> Dict[str, Tuple[str, ...]]:
         """
-        Calculate which week in the cycle the target date corresponds to.
+        Resolve a week bucket (whole weeks since the schedule start) to its assignments.
 
         Arg(s):
-            schedule_start (datetime): The start date of the first week in the schedule.
-            target_date (datetime): The date to calculate the week for.
-            cycle_length (int): The number of weeks in the rotation cycle.
+            week_bucket (int): Number of whole weeks between the schedule start and the target date.
 
         Return Value(s):
-            int: The week index in the cycle (0 to cycle_length-1).
+            Dict[str, Tuple[str, ...]]: Dictionary containing release_artistry and focused_work assignments.
         """
-        days_diff = (target_date - schedule_start).days
-        weeks_diff = days_diff // 7
-        return weeks_diff % cycle_length
+        week_index = week_bucket % self._cycle_length
+        return {
+            "release_artistry": self._release_artistry[week_index],
+            "focused_work": self._focused_work[week_index],
+        }
 
-    def get_schedule_for_date(self, target_date: datetime) -> Dict[str, List[str]]:
+    def get_schedule_for_date(self, target_date: date) -> Dict[str, Tuple[str, ...]]:
         """
         Get the schedule for a specific date.
 
         Arg(s):
-            target_date (datetime): The date to get the schedule for.
+            target_date (date): The date to get the schedule for.
 
         Return Value(s):
-            Dict[str, List[str]]: Dictionary containing release_artistry and focused_work assignments.
+            Dict[str, Tuple[str, ...]]: Dictionary containing release_artistry and focused_work assignments.
         """
         if not self.schedule:
             raise ValueError("No schedule data available")
 
-        schedule_start = self.schedule[0][0]
-        cycle_length = len(self.schedule)
-
-        # Calculate which week in the cycle this date corresponds to
-        week_index = self._calculate_week_in_cycle(schedule_start, target_date, cycle_length)
-
-        # Get the schedule for that week in the cycle
-        _, release_artistry, focused_work = self.schedule[week_index]
-
-        return {"release_artistry": release_artistry, "focused_work": focused_work}
+        # All dates in the same week share a bucket, so repeat lookups are cache
+        # hits; copy the memoized dict so a caller mutating the result can't
+        # poison the cache (the tuple values themselves are immutable)
+        return dict(self._lookup((target_date.toordinal() - self._start_ordinal) // 7))
 
     def get_cycle_info(self) -> Dict[str, any]:
         """
@@ -289,50 +453,107 @@ class ScheduleNotifier:
         Return Value(s):
             str: Comma-separated list with proper Slack mentions.
         """
+        get_user_id = self.slack_user_mapping.get
         formatted = []
+        missing = []
         for name in people:
-            if name in self.slack_user_mapping:
+            user_id = get_user_id(name)
+            if user_id:
                 # Use proper Slack mention format with user ID
-                user_id = self.slack_user_mapping[name]
                 formatted.append(f"<@{user_id}>")
             else:
                 # Fall back to @name if no mapping found
                 formatted.append(f"@{name}")
-                self.logger.warning("No Slack user ID found for '%s', using @mention fallback", name)
+                missing.append(name)
+
+        if missing:
+            self.logger.warning("No Slack user ID found for %s, using @mention fallback", missing)
 
         return ", ".join(formatted)
 
-    def _get_managed_user_ids(self) -> set:
+    def _get_managed_user_ids(self) -> frozenset:
         """
         Get the set of user IDs that are managed by this schedule system.
 
         Return Value(s):
-            set: Set of Slack user IDs for users in the SLACK_USER_MAPPING.
+            frozenset: Set of Slack user IDs for users in the SLACK_USER_MAPPING.
         """
-        return set(self.slack_user_mapping.values())
+        return self._managed_user_ids
 
-    def _get_user_group_members(self) -> List[str]:
+    def _get_user_group_members(self) -> frozenset:
         """
         Get the current members of the Slack user group.
 
         Return Value(s):
-            List[str]: List of Slack user IDs in the user group.
+            frozenset: Set of Slack user IDs in the user group.
         """
         if not self.slack_client:
             self.logger.info("[DRY RUN] No Slack client available, cannot fetch current user group members")
-            return []
+            return frozenset()
+
+        from slack_sdk.errors import SlackApiError
 
         try:
             response = self.slack_client.usergroups_users_list(usergroup=self.slack_user_group_id)
-            members = response.get("users", [])
-            log_prefix = "[DRY RUN] " if self.dry_run else ""
-            self.logger.info("%sCurrent user group has %d members: %s", log_prefix, len(members), members)
+            members = frozenset(response.get("users") or ())
+            if self.logger.isEnabledFor(logging.INFO):
+                log_prefix = "[DRY RUN] " if self.dry_run else ""
+                self.logger.info("%sCurrent user group has %d members: %s", log_prefix, len(members), sorted(members))
             return members
 
         except SlackApiError as e:
             self.logger.error("Failed to get user group members: %s", e.response["error"])
             raise
 
+    def _user_group_cache_path(self) -> Path:
+        """
+        Return the path of the on-disk cache for the configured user group.
+
+        Return Value(s):
+            Path: Cache file path under ~/.cache/schedule_notifier/.
+        """
+        return Path.home() / ".cache" / "schedule_notifier" / f"{self.slack_user_group_id}.json"
+
+    def _read_cached_user_group_members(self) -> Optional[set]:
+        """
+        Read the last-known user group member set from the on-disk cache.
+
+        Return Value(s):
+            Optional[set]: Set of Slack user IDs, or None if the cache is
+                missing, unreadable, or older than the TTL.
+        """
+        try:
+            data = _json_loads(self._user_group_cache_path().read_text())
+        except (OSError, ValueError):
+            return None
+
+        # Treat any shape other than {"members": [...], "ts": <number>} as a miss
+        if not isinstance(data, dict):
+            return None
+        members = data.get("members")
+        ts = data.get("ts")
+        if not isinstance(members, list) or not isinstance(ts, (int, float)):
+            return None
+
+        if time.time() - ts > _USER_GROUP_CACHE_TTL:
+            return None
+
+        return set(members)
+
+    def _write_user_group_cache(self, members) -> None:
+        """
+        Persist the user group member set to the on-disk cache.
+
+        Arg(s):
+            members: Iterable of Slack user IDs currently in the group.
+        """
+        cache_path = self._user_group_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_json_dumps({"members": sorted(members), "ts": time.time()}))
+        except OSError as e:
+            self.logger.warning("Failed to write user group cache %s: %s", cache_path, e)
+
     def _update_user_group(self, release_artistry_names: List[str]) -> None:
         """
         Update the Slack user group with the current release artistry team.
@@ -353,12 +574,27 @@ class ScheduleNotifier:
             else:
                 self.logger.warning("No Slack user ID found for '%s', cannot add to user group", name)
 
-        # Get current members (may be empty if no Slack client available)
-        current_members = set(self._get_user_group_members())
-
         # Identify which users are managed by this system
         managed_user_ids = self._get_managed_user_ids()
 
+        # Consult the cached member list first: when it already matches the
+        # desired membership, skip both API calls; when it differs, trust it as
+        # the current state and skip just the Tier-2 list call
+        current_members = None
+        if not self.dry_run:
+            cached_members = self._read_cached_user_group_members()
+            if cached_members is not None:
+                desired_members = (cached_members - managed_user_ids) | release_artistry_ids
+                if desired_members == cached_members:
+                    self.logger.info("User group %s is up to date per cache, skipping API calls", self.slack_user_group_id)
+                    return
+                self.logger.info("Using cached member list for user group %s", self.slack_user_group_id)
+                current_members = cached_members
+
+        # Get current members (may be empty if no Slack client available)
+        if current_members is None:
+            current_members = self._get_user_group_members()
+
         # Preserve non-managed members (users not in our SLACK_USER_MAPPING)
         preserved_members = current_members - managed_user_ids
 
@@ -389,8 +625,11 @@ class ScheduleNotifier:
         # Check if update is needed
         if current_members == set(new_members):
             self.logger.info("User group is already up to date, no changes needed")
+            self._write_user_group_cache(current_members)
             return
 
+        from slack_sdk.errors import SlackApiError
+
         try:
             response = self.slack_client.usergroups_users_update(
                 usergroup=self.slack_user_group_id,
@@ -399,6 +638,7 @@ class ScheduleNotifier:
             self.logger.info("User group updated successfully")
             self.logger.info("Preserved %d non-managed members", len(preserved_members))
             self.logger.info("Added %d release artistry members", len(release_artistry_ids))
+            self._write_user_group_cache(new_members)
 
             # Log the changes for visibility
             added = release_artistry_ids - current_members
@@ -412,13 +652,13 @@ class ScheduleNotifier:
             self.logger.error("Failed to update user group: %s", e.response["error"])
             raise
 
-    def send_schedule_notification(self, schedule_data: Dict[str, List[str]], target_date: datetime) -> None:
+    def send_schedule_notification(self, schedule_data: Dict[str, Tuple[str, ...]], target_date: date) -> None:
         """
         Send a Slack notification about the current week's schedule.
 
         Arg(s):
-            schedule_data (Dict[str, List[str]]): Schedule data with release_artistry and focused_work.
-            target_date (datetime): The date for this schedule.
+            schedule_data (Dict[str, Tuple[str, ...]]): Schedule data with release_artistry and focused_work.
+            target_date (date): The date for this schedule.
         """
         release_artistry = self._format_people_list(schedule_data["release_artistry"])
         focused_work = self._format_people_list(schedule_data["focused_work"])
@@ -435,6 +675,8 @@ class ScheduleNotifier:
             self.logger.info("[DRY RUN] Would send to %s: %s", self.slack_channel, message)
             return
 
+        from slack_sdk.errors import SlackApiError
+
         try:
             response = self.slack_client.chat_postMessage(
                 channel=self.slack_channel,
@@ -447,9 +689,59 @@ class ScheduleNotifier:
             self.logger.error("Failed to send Slack message: %s", e.response["error"])
             raise
 
+    def send_many(self, messages: List[Tuple[str, str]]) -> None:
+        """
+        Send multiple Slack messages through a single background worker.
+
+        Messages are drained from a queue by one thread over the shared client,
+        so batch sends reuse a single HTTP connection and don't block the
+        caller between posts.
+
+        Arg(s):
+            messages (List[Tuple[str, str]]): List of (channel, text) pairs to send.
+        """
+        if not messages:
+            return
+
+        from slack_sdk.errors import SlackApiError
+
+        pending: queue.Queue = queue.Queue()
+        for channel, text in messages:
+            pending.put((channel, text))
+
+        def _drain() -> None:
+            while True:
+                try:
+                    channel, text = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    if self.dry_run:
+                        self.logger.info("[DRY RUN] Would send to %s: %s", channel, text)
+                    else:
+                        self.slack_client.chat_postMessage(
+                            channel=channel,
+                            text=text,
+                            username="schedule-bot",
+                            icon_emoji=":calendar:",
+                        )
+                except SlackApiError as e:
+                    self.logger.error("Failed to send Slack message to %s: %s", channel, e.response["error"])
+                except Exception:
+                    # Keep draining no matter what fails: an escaped exception
+                    # would kill the worker with items still unacknowledged and
+                    # leave pending.join() blocked forever
+                    self.logger.exception("Failed to send Slack message to %s", channel)
+                finally:
+                    pending.task_done()
+
+        worker = threading.Thread(target=_drain, daemon=True)
+        worker.start()
+        pending.join()
+
 
 @click.command()
-@click.option('--date', type=str, help='Target date in format "Feb 9, 2026" (defaults to today)', default=None)
+@click.option('--date', 'date_str', type=str, help='Target date in format "Feb 9, 2026" (defaults to today)', default=None)
 @click.option(
     '--schedule-file',
     type=click.Path(exists=False, path_type=Path),
@@ -460,7 +752,7 @@ class ScheduleNotifier:
 @click.option('--notify-slack', is_flag=True, help='Send Slack notification about the schedule', default=False)
 @click.option('--dry-run', is_flag=True, help='Dry run mode (logs Slack messages instead of sending)', default=False)
 def main(
-    date: Optional[str], schedule_file: Optional[Path], pretty: bool, notify_slack: bool, dry_run: bool
+    date_str: Optional[str], schedule_file: Optional[Path], pretty: bool, notify_slack: bool, dry_run: bool
 ) -> None:
     """
     Get the current week's rotation schedule.
@@ -477,14 +769,14 @@ def main(
 
     try:
         # Determine target date
-        if date:
+        if date_str:
             try:
-                target_date = datetime.strptime(date, "%b %d, %Y")
-            except ValueError:
-                click.echo(f"Error: Invalid date format '{date}'. Use format like 'Feb 9, 2026'", err=True)
+                target_date = _parse_date(date_str)
+            except (KeyError, ValueError):
+                click.echo(f"Error: Invalid date format '{date_str}'. Use format like 'Feb 9, 2026'", err=True)
                 raise click.Abort()
         else:
-            target_date = datetime.now()
+            target_date = date.today()
 
         # Determine schedule file or content
         schedule_content = None
@@ -510,17 +802,23 @@ def main(
 
         result = {"schedule": schedule_data}
 
-        # Output result
-        if pretty:
-            click.echo(json.dumps(result, indent=2))
-        else:
-            click.echo(json.dumps(result))
+        # Output result (bytes straight to stdout, no intermediate str)
+        sys.stdout.buffer.write(_json_dumps(result, pretty=pretty))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
 
-        # Send Slack notification if requested
+        # Send Slack notification if requested. The channel message and the
+        # user group maintenance are independent, so run them concurrently and
+        # pay for one Slack round-trip of latency instead of the sum.
         if notify_slack:
             notifier.new_slack_client()
-            notifier.send_schedule_notification(schedule_data, target_date)
-            notifier._update_user_group(schedule_data["release_artistry"])
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(notifier.send_schedule_notification, schedule_data, target_date),
+                    executor.submit(notifier._update_user_group, schedule_data["release_artistry"]),
+                ]
+                for future in futures:
+                    future.result()
             if dry_run:
                 click.echo(f"[DRY RUN] Would send Slack notification to {notifier.slack_channel}")
             else:
@@ -531,5 +829,40 @@ def main(
         raise click.Abort()
 
 
+def _fast_path() -> None:
+    """
+    Print today's schedule without going through click.
+
+    Handles only the bare `python schedule_notifier.py` invocation (the common
+    cron shape): read SCHEMA, look up today, write JSON. Any flags go through
+    the regular click entry point.
+    """
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    schema_env = os.environ.get("SCHEMA")
+    if not schema_env:
+        sys.stderr.write(
+            "Error: SCHEMA environment variable is not set. Please set it to the path of the schema file.\n"
+        )
+        raise SystemExit(1)
+
+    try:
+        # Check if SCHEMA is a file path or actual content (same heuristic as main)
+        if '\n' in schema_env or schema_env.strip().startswith('├') or schema_env.strip().startswith('|'):
+            notifier = ScheduleNotifier(schedule_content=schema_env)
+        else:
+            notifier = ScheduleNotifier(schedule_file=Path(schema_env))
+        schedule_data = notifier.get_schedule_for_date(date.today())
+    except (FileNotFoundError, ValueError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        raise SystemExit(1)
+
+    sys.stdout.buffer.write(_json_dumps({"schedule": schedule_data}))
+    sys.stdout.buffer.write(b"\n")
+
+
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 1:
+        _fast_path()
+    else:
+        main()